@@ -4,7 +4,82 @@ import http.client
 import sys
 import time
 import json
+import os
+import random
 import socket
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Retry backoff: localhost probes usually recover within milliseconds
+RETRY_BASE_DELAY = 0.05
+RETRY_MAX_DELAY = 1.0
+
+# Short-lived result cache shared between invocations (e.g. load balancer polls).
+# Failures expire sooner than successes so problems are re-probed quickly.
+HEALTH_CACHE_PATH = os.path.join(tempfile.gettempdir(), "excel_mcp_health.json")
+CACHE_TTL_SUCCESS = 10
+CACHE_TTL_FAILURE = 3
+
+# Keep-alive HTTP connections shared across probes, keyed by (host, port)
+_conn_cache = {}
+_conn_lock = threading.Lock()
+
+def retry_delay(attempt):
+    """Exponential backoff with jitter for the given (zero-based) attempt."""
+    delay = min(RETRY_BASE_DELAY * (2 ** attempt), RETRY_MAX_DELAY)
+    return delay * random.uniform(0.5, 1.0)
+
+def _lock_file(f, exclusive):
+    """Lock the cache file so concurrent invocations don't interleave."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+def _open_cache(flags):
+    """Open the cache file, refusing symlinks and files owned by another user.
+
+    The file sits in the shared temp directory, where anyone could plant a
+    symlink for us to clobber or a file reporting a fake "ok".
+    """
+    fd = os.open(HEALTH_CACHE_PATH, flags | getattr(os, "O_NOFOLLOW", 0), 0o600)
+    try:
+        if hasattr(os, "getuid") and os.fstat(fd).st_uid != os.getuid():
+            raise PermissionError(f"{HEALTH_CACHE_PATH} is owned by another user")
+    except OSError:
+        os.close(fd)
+        raise
+    return fd
+
+def load_cached_results():
+    """Load cached check results, returning an empty dict if unavailable."""
+    try:
+        with os.fdopen(_open_cache(os.O_RDONLY), "r") as f:
+            _lock_file(f, exclusive=False)
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def store_cached_results(updates):
+    """Merge fresh check results into the cache file."""
+    try:
+        with os.fdopen(_open_cache(os.O_RDWR | os.O_CREAT), "r+") as f:
+            _lock_file(f, exclusive=True)
+            try:
+                cache = json.load(f)
+            except ValueError:
+                cache = {}
+            cache.update(updates)
+            f.seek(0)
+            f.truncate()
+            json.dump(cache, f)
+    except OSError as e:
+        # Caching is best-effort; never fail the health check because of it
+        print(f"Warning: could not write health cache: {str(e)}")
 
 def check_port(host, port, max_retries=3):
     """Check if a port is open and listening."""
@@ -26,16 +101,30 @@ def check_port(host, port, max_retries=3):
             if attempt == max_retries - 1:
                 return False, f"Failed to connect to {host}:{port}: {str(e)}"
         
-        # Wait before retrying
-        time.sleep(1)
+        # Back off before retrying (no sleep after the final attempt)
+        if attempt < max_retries - 1:
+            time.sleep(retry_delay(attempt))
+
+def _acquire_connection(host, port):
+    """Take a cached keep-alive connection for (host, port) or open a new one."""
+    with _conn_lock:
+        conn = _conn_cache.pop((host, port), None)
+    return conn or http.client.HTTPConnection(host, port, timeout=5)
+
+def _release_connection(host, port, conn):
+    """Return a healthy connection to the cache, closing it if one is already cached."""
+    with _conn_lock:
+        if (host, port) not in _conn_cache:
+            _conn_cache[(host, port)] = conn
+            return
+    conn.close()
 
 def check_endpoint(host, port, path, method="GET", max_retries=3):
     """Check if an endpoint is responding correctly."""
     for attempt in range(max_retries):
+        # Reuse a keep-alive connection to the server when one is available
+        conn = _acquire_connection(host, port)
         try:
-            # Connect to the server
-            conn = http.client.HTTPConnection(host, port, timeout=5)
-            
             # Send a request to the health endpoint
             conn.request(method, path)
             
@@ -44,6 +133,13 @@ def check_endpoint(host, port, path, method="GET", max_retries=3):
             
             # Read the response body
             body = response.read()
+        except Exception as e:
+            # Drop the broken connection so the next attempt reconnects
+            conn.close()
+            if attempt == max_retries - 1:
+                return False, f"Failed to connect to {host}:{port}{path}: {str(e)}"
+        else:
+            _release_connection(host, port, conn)
             
             # Check if the server is responding
             if 200 <= response.status < 300:
@@ -51,33 +147,52 @@ def check_endpoint(host, port, path, method="GET", max_retries=3):
             else:
                 if attempt == max_retries - 1:
                     return False, f"{host}:{port}{path} returned status {response.status}, body: {body}"
-        except Exception as e:
-            if attempt == max_retries - 1:
-                return False, f"Failed to connect to {host}:{port}{path}: {str(e)}"
-        finally:
-            conn.close() if 'conn' in locals() else None
             
-        # Wait before retrying
-        time.sleep(1)
+        # Back off before retrying (no sleep after the final attempt)
+        if attempt < max_retries - 1:
+            time.sleep(retry_delay(attempt))
 
 def check_all_endpoints():
-    results = []
-    
-    # Check if MCP server port is open and listening
-    mcp_port_healthy, mcp_port_message = check_port("localhost", 8000)
-    results.append(("MCP Server Port", mcp_port_healthy, mcp_port_message))
+    # The probes are independent and network-bound, so run them concurrently
+    checks = [
+        # Check if MCP server port is open and listening
+        ("MCP Server Port", check_port, ("localhost", 8000)),
+        # Check if Web server port is open and listening
+        ("Web Server Port", check_port, ("localhost", 8080)),
+        # Check Web server health endpoint
+        ("Web Server /health", check_endpoint, ("localhost", 8080, "/health")),
+        # Check if /api/files endpoint works on the web server
+        ("Web Server /api/files", check_endpoint, ("localhost", 8080, "/api/files")),
+    ]
     
-    # Check if Web server port is open and listening
-    web_port_healthy, web_port_message = check_port("localhost", 8080)
-    results.append(("Web Server Port", web_port_healthy, web_port_message))
+    # Reuse recent results so repeated invocations don't re-probe
+    now = time.time()
+    cache = load_cached_results()
+    outcomes = {}
+    pending = []
+    for label, fn, args in checks:
+        entry = cache.get(label)
+        if entry and now < entry.get("expires", 0):
+            outcomes[label] = (label, entry["ok"], entry["msg"])
+        else:
+            pending.append((label, fn, args))
     
-    # Check Web server health endpoint
-    web_healthy, web_message = check_endpoint("localhost", 8080, "/health")
-    results.append(("Web Server /health", web_healthy, web_message))
+    if pending:
+        fresh = {}
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = {executor.submit(fn, *args): label for label, fn, args in pending}
+            for future in as_completed(futures):
+                is_healthy, message = future.result()
+                outcomes[futures[future]] = (futures[future], is_healthy, message)
+                fresh[futures[future]] = {
+                    "ok": is_healthy,
+                    "msg": message,
+                    "expires": time.time() + (CACHE_TTL_SUCCESS if is_healthy else CACHE_TTL_FAILURE),
+                }
+        store_cached_results(fresh)
     
-    # Check if /api/files endpoint works on the web server
-    api_healthy, api_message = check_endpoint("localhost", 8080, "/api/files")
-    results.append(("Web Server /api/files", api_healthy, api_message))
+    # Report in a stable order regardless of completion order
+    results = [outcomes[label] for label, _, _ in checks]
     
     return results
 
@@ -2,6 +2,7 @@ import asyncio
 import os
 import threading
 import signal
+import socket
 import sys
 import time
 import uvicorn
@@ -13,13 +14,34 @@ def run_fastapi():
     port = int(os.environ.get("FASTAPI_PORT", "8080"))
     uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
 
+def wait_for_port(port, host="127.0.0.1", timeout=5.0, interval=0.02):
+    """Poll until a TCP port accepts connections. Returns False on timeout."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.05)
+            if sock.connect_ex((host, port)) == 0:
+                return True
+        time.sleep(interval)
+    return False
+
 def signal_handler(sig, frame):
     """Handle interrupt signals properly."""
     print("\nShutting down servers...")
     sys.exit(0)
 
+def install_event_loop():
+    """Use uvloop for asyncio when it is available (it is not on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 def main():
     """Start the Excel MCP server and FastAPI web server."""
+    install_event_loop()
+    
     # Register signal handler
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -40,9 +62,11 @@ def main():
         fastapi_thread = threading.Thread(target=run_fastapi, daemon=True)
         fastapi_thread.start()
         
-        # Give FastAPI time to start
-        time.sleep(1)
-        print(f"✓ Web interface available at http://0.0.0.0:{fastapi_port}")
+        # Wait until FastAPI is accepting connections
+        if wait_for_port(int(fastapi_port)):
+            print(f"✓ Web interface available at http://0.0.0.0:{fastapi_port}")
+        else:
+            print(f"✗ Web interface did not start listening on port {fastapi_port}")
         
         # Run MCP server in the main thread
         mcp_port = os.environ.get('FASTMCP_PORT', '8000')
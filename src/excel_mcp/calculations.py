@@ -1,6 +1,8 @@
 from typing import Any
 import logging
 
+from openpyxl import Workbook
+
 from .workbook import get_or_create_workbook
 from .cell_utils import validate_cell_reference
 from .exceptions import ValidationError, CalculationError
@@ -12,14 +14,20 @@ def apply_formula(
     filepath: str,
     sheet_name: str,
     cell: str,
-    formula: str
+    formula: str,
+    wb: Workbook | None = None
 ) -> dict[str, Any]:
-    """Apply any Excel formula to a cell."""
+    """Apply any Excel formula to a cell.
+
+    Pass an already open workbook for filepath as wb to skip loading it again;
+    it is saved to filepath either way.
+    """
     try:
         if not validate_cell_reference(cell):
             raise ValidationError(f"Invalid cell reference: {cell}")
             
-        wb = get_or_create_workbook(filepath)
+        if wb is None:
+            wb = get_or_create_workbook(filepath)
         if sheet_name not in wb.sheetnames:
             raise ValidationError(f"Sheet '{sheet_name}' not found")
             
@@ -6,10 +6,12 @@ and exporting Excel worksheets as CSV files.
 """
 from pathlib import Path
 import csv
+import io
 import os
 import base64
 import logging
-from typing import Dict, Any, List, Optional, Union, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Iterable, List, Optional, Set, Union, Tuple
 
 import openpyxl
 from openpyxl import load_workbook
@@ -20,6 +22,208 @@ from .exceptions import DataError, FileOperationError
 
 logger = logging.getLogger(__name__)
 
+# Number of rows handed to csv.writer.writerows() at a time during export
+CSV_WRITE_BATCH_SIZE = 1024
+
+def _load_or_create_workbook(
+    filepath: Path,
+    create_if_missing: bool,
+    write_only: bool = False
+) -> Workbook:
+    """
+    Load the workbook at filepath, creating an empty one if allowed.
+    
+    With write_only=True a newly created workbook streams rows straight to
+    the file on save instead of keeping Cell objects in memory. Its sheets
+    only support append() and cannot be read back, so only use it when each
+    sheet is written exactly once.
+    """
+    # Check if directory exists, create if necessary
+    if not filepath.parent.exists():
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Check if file exists, create if necessary and allowed
+    if not filepath.exists():
+        if create_if_missing:
+            if write_only:
+                # Write-only workbooks start without a default worksheet
+                return Workbook(write_only=True)
+            wb = Workbook()
+            # Remove default worksheet
+            if "Sheet" in wb.sheetnames:
+                del wb["Sheet"]
+            return wb
+        raise FileOperationError(f"Excel file {filepath} does not exist and create_if_missing is False")
+    
+    return load_workbook(filepath)
+
+def _replace_sheet(wb: Workbook, sheet: Worksheet, replacement: Worksheet) -> None:
+    """
+    Put replacement in place of sheet, taking over its name and tab position.
+    
+    Much cheaper than delete_rows() on a large sheet, which shifts every
+    remaining cell. Sheet-level settings (column widths, merges, etc.) are
+    discarded along with the content.
+    """
+    index = wb.index(sheet)
+    was_active = wb.active is sheet
+    title = sheet.title
+    wb.remove(sheet)
+    replacement.title = title
+    wb.move_sheet(replacement, index - wb.index(replacement))
+    if was_active:
+        wb.active = index
+
+def _discard_sheet(wb: Workbook, sheet: Worksheet) -> None:
+    """
+    Remove a staging sheet from the workbook.
+    
+    A write-only sheet streams its rows into a temp file that openpyxl only
+    deletes at interpreter exit, so close that file and delete it now.
+    """
+    wb.remove(sheet)
+    writer = getattr(sheet, "_writer", None)
+    if writer is not None:
+        writer.close()
+        os.remove(writer.out)
+
+def _unique_sheet_name(base_name: str, sheet_names: Set[str]) -> str:
+    """First of base_name_1, base_name_2, ... not already in sheet_names."""
+    counter = 1
+    new_name = f"{base_name}_{counter}"
+    while new_name in sheet_names:
+        counter += 1
+        new_name = f"{base_name}_{counter}"
+    return new_name
+
+def _apply_rows_to_workbook(
+    wb: Workbook,
+    rows: Iterable[List[str]],
+    sheet_name: Optional[str] = None,
+    merge_mode: str = 'replace',
+    sheet_names: Optional[Set[str]] = None
+) -> Dict[str, Any]:
+    """
+    Write parsed CSV rows into an already loaded workbook without saving it.
+    
+    Rows are streamed into a new sheet and only merged into the workbook
+    once every row has been written, so if reading or writing a row raises,
+    the workbook is left exactly as it was.
+    
+    sheet_names is a snapshot of wb.sheetnames that is kept up to date as
+    sheets are created, so callers importing several CSVs into the same
+    workbook can share one instead of rebuilding the list for every lookup.
+    
+    Returns:
+        Dict with the target sheet name and imported row/column counts
+    """
+    if sheet_names is None:
+        sheet_names = set(wb.sheetnames)
+    
+    # Determine target sheet: an existing sheet to replace or append to, or
+    # the name of a sheet to create
+    target = None
+    if sheet_name is None:
+        # Use first sheet or create one if workbook is empty
+        if sheet_names and merge_mode == 'new_sheet':
+            # Leave the active sheet alone and import next to it
+            actual_sheet_name = _unique_sheet_name(wb.active.title, sheet_names)
+        elif sheet_names:
+            target = wb.active
+            actual_sheet_name = target.title
+            
+            # Rows are appended below existing content, so replace the
+            # sheet unless we are explicitly appending
+            if merge_mode != 'append':
+                merge_mode = 'replace'
+        else:
+            actual_sheet_name = "CSV_Import"
+    else:
+        # Use specified sheet or create it
+        if sheet_name in sheet_names and merge_mode == 'new_sheet':
+            # Create a new sheet with incremented name
+            actual_sheet_name = _unique_sheet_name(sheet_name, sheet_names)
+        elif sheet_name in sheet_names:
+            # Replace, or append for any other mode
+            target = wb[sheet_name]
+            actual_sheet_name = sheet_name
+        else:
+            actual_sheet_name = sheet_name
+    
+    # Stream rows into a fresh sheet rather than materializing them first
+    sheet = wb.create_sheet(None if target is not None else actual_sheet_name)
+    row_count = 0
+    column_count = 0
+    try:
+        for row in rows:
+            if row_count == 0:
+                column_count = len(row)
+            sheet.append(row)
+            row_count += 1
+    except Exception:
+        _discard_sheet(wb, sheet)
+        raise
+    
+    if target is None:
+        sheet_names.add(actual_sheet_name)
+    elif merge_mode == 'replace':
+        _replace_sheet(wb, target, sheet)
+    else:
+        # append() writes below the last used row of the existing sheet.
+        # Only copy real values; iter_rows pads short rows with None
+        for row in sheet.iter_rows(values_only=True):
+            target.append({column: value for column, value in enumerate(row, 1) if value is not None})
+        wb.remove(sheet)
+    
+    return {
+        "sheet_name": actual_sheet_name,
+        "rows_imported": row_count,
+        "columns_imported": column_count,
+    }
+
+def _apply_csv_to_workbook(
+    wb: Workbook,
+    csv_content: str,
+    sheet_name: Optional[str] = None,
+    delimiter: str = ',',
+    merge_mode: str = 'replace',
+    sheet_names: Optional[Set[str]] = None
+) -> Dict[str, Any]:
+    """
+    Import CSV content into an already loaded workbook without saving it.
+    
+    Returns:
+        Dict with the target sheet name and imported row/column counts
+    """
+    # Parse CSV content lazily while writing
+    csv_reader = csv.reader(io.StringIO(csv_content), delimiter=delimiter)
+    return _apply_rows_to_workbook(wb, csv_reader, sheet_name, merge_mode, sheet_names)
+
+def _import_rows_to_excel(
+    filepath: Path,
+    rows: Iterable[List[str]],
+    sheet_name: Optional[str],
+    create_if_missing: bool,
+    merge_mode: str
+) -> Dict[str, Any]:
+    """Load or create the workbook at filepath, write rows into it and save."""
+    # A new file only ever receives this one sheet, so it can be written
+    # in streaming write-only mode
+    wb = _load_or_create_workbook(filepath, create_if_missing, write_only=True)
+    result = _apply_rows_to_workbook(wb, rows, sheet_name, merge_mode)
+            
+    # Save workbook
+    wb.save(filepath)
+    
+    return {
+        "success": True,
+        "message": f"Imported CSV data to {result['sheet_name']} in {filepath.name}",
+        "rows_imported": result["rows_imported"],
+        "columns_imported": result["columns_imported"],
+        "sheet_name": result["sheet_name"],
+        "filepath": str(filepath)
+    }
+
 def import_csv_to_excel(
     filepath: Path | str,
     csv_content: str,
@@ -47,90 +251,112 @@ def import_csv_to_excel(
         if isinstance(filepath, str):
             filepath = Path(filepath)
             
-        # Check if directory exists, create if necessary
-        if not filepath.parent.exists():
-            filepath.parent.mkdir(parents=True, exist_ok=True)
+        csv_reader = csv.reader(io.StringIO(csv_content), delimiter=delimiter)
+        return _import_rows_to_excel(filepath, csv_reader, sheet_name, create_if_missing, merge_mode)
         
-        # Check if file exists, create if necessary and allowed
-        if not filepath.exists():
-            if create_if_missing:
-                wb = Workbook()
-                # Remove default worksheet
-                if "Sheet" in wb.sheetnames:
-                    del wb["Sheet"]
-            else:
-                raise FileOperationError(f"Excel file {filepath} does not exist and create_if_missing is False")
-        else:
-            wb = load_workbook(filepath)
+    except Exception as e:
+        logger.error(f"Error importing CSV to Excel: {e}")
+        raise FileOperationError(f"Failed to import CSV: {str(e)}")
+
+def _import_csv_bytes(
+    filepath: Path | str,
+    csv_bytes: bytes,
+    sheet_name: Optional[str] = None,
+    delimiter: str = ',',
+    create_if_missing: bool = True,
+    merge_mode: str = 'replace'
+) -> Dict[str, Any]:
+    """
+    Import UTF-8 encoded CSV bytes into an Excel workbook.
+    
+    The bytes are decoded incrementally while the CSV is parsed, so no
+    decoded copy of the whole payload is built. Other args are the same as
+    import_csv_to_excel.
+    """
+    try:
+        # Convert string path to Path object if needed
+        if isinstance(filepath, str):
+            filepath = Path(filepath)
             
-        # Determine target sheet
-        if sheet_name is None:
-            # Use first sheet or create one if workbook is empty
-            if len(wb.sheetnames) > 0:
-                sheet = wb.active
-                actual_sheet_name = sheet.title
-            else:
-                sheet = wb.create_sheet("CSV_Import")
-                actual_sheet_name = "CSV_Import"
-        else:
-            # Use specified sheet or create it
-            if sheet_name in wb.sheetnames:
-                sheet = wb[sheet_name]
-                actual_sheet_name = sheet_name
-                
-                # Handle merge mode
-                if merge_mode == 'replace':
-                    # Clear existing sheet content
-                    sheet.delete_rows(1, sheet.max_row)
-                elif merge_mode == 'new_sheet':
-                    # Create a new sheet with incremented name
-                    base_name = sheet_name
-                    counter = 1
-                    new_name = f"{base_name}_{counter}"
-                    while new_name in wb.sheetnames:
-                        counter += 1
-                        new_name = f"{base_name}_{counter}"
-                    sheet = wb.create_sheet(new_name)
-                    actual_sheet_name = new_name
-                # For append mode, we don't need to do anything special here
-            else:
-                sheet = wb.create_sheet(sheet_name)
-                actual_sheet_name = sheet_name
-        
-        # Parse CSV content
-        import io
-        csv_file = io.StringIO(csv_content)
+        csv_file = io.TextIOWrapper(io.BytesIO(csv_bytes), encoding='utf-8', newline='')
         csv_reader = csv.reader(csv_file, delimiter=delimiter)
-        rows = list(csv_reader)
-        
-        # Determine starting row for append mode
-        start_row = 1
-        if merge_mode == 'append' and sheet.max_row > 0:
-            start_row = sheet.max_row + 1
-            
-        # Write to Excel
-        for i, row in enumerate(rows, start=start_row):
-            for j, value in enumerate(row, start=1):
-                cell = sheet.cell(row=i, column=j)
-                cell.value = value
-                
-        # Save workbook
-        wb.save(filepath)
-        
-        return {
-            "success": True,
-            "message": f"Imported CSV data to {actual_sheet_name} in {filepath.name}",
-            "rows_imported": len(rows),
-            "columns_imported": len(rows[0]) if rows else 0,
-            "sheet_name": actual_sheet_name,
-            "filepath": str(filepath)
-        }
+        return _import_rows_to_excel(filepath, csv_reader, sheet_name, create_if_missing, merge_mode)
         
     except Exception as e:
         logger.error(f"Error importing CSV to Excel: {e}")
         raise FileOperationError(f"Failed to import CSV: {str(e)}")
 
 
+def _ws_to_csv(
+    wb: Workbook,
+    sheet_name: Optional[str] = None,
+    delimiter: str = ',',
+    as_base64: bool = False
+) -> Dict[str, Any]:
+    """
+    Serialize one worksheet of an already loaded workbook to CSV.
+    
+    Returns:
+        Dict with result information including CSV content, or base64 encoded
+        CSV content under csv_content_base64 if as_base64 is True
+    """
+    # Determine which sheet to export
+    if sheet_name is None:
+        sheet = wb.active
+        actual_sheet_name = sheet.title
+    elif sheet_name in wb.sheetnames:
+        sheet = wb[sheet_name]
+        actual_sheet_name = sheet_name
+    else:
+        raise FileOperationError(f"Sheet '{sheet_name}' not found in workbook")
+        
+    # Stream rows straight into the CSV writer in a single pass
+    output = io.StringIO()
+    csv_writer = csv.writer(output, delimiter=delimiter)
+    rows_exported = 0
+    
+    # Rows are passed to the writer as-is: csv.writer already writes None as
+    # an empty string and str()s other values. They are written in batches
+    # to cut down on Python -> C calls.
+    batch = []
+    for row in sheet.iter_rows(values_only=True):
+        # Skip empty rows (where all cells are None). Rows are tuples, so
+        # count() does the check in C rather than a generator per row
+        row_length = len(row)
+        if row_length and row.count(None) != row_length:
+            batch.append(row)
+            if len(batch) >= CSV_WRITE_BATCH_SIZE:
+                csv_writer.writerows(batch)
+                rows_exported += len(batch)
+                batch.clear()
+    if batch:
+        csv_writer.writerows(batch)
+        rows_exported += len(batch)
+            
+    if rows_exported == 0:
+        result = {
+            "success": True,
+            "message": f"Exported empty sheet {actual_sheet_name} to CSV",
+            "rows_exported": 0,
+            "sheet_name": actual_sheet_name,
+        }
+    else:
+        result = {
+            "success": True,
+            "message": f"Exported {actual_sheet_name} to CSV",
+            "rows_exported": rows_exported,
+            "sheet_name": actual_sheet_name,
+        }
+    
+    if as_base64:
+        # Base64 output is pure ASCII, so skip UTF-8 validation on decode
+        csv_bytes = output.getvalue().encode('utf-8')
+        result["csv_content_base64"] = base64.b64encode(csv_bytes).decode('ascii')
+    else:
+        result["csv_content"] = output.getvalue()
+    
+    return result
+
 def export_worksheet_to_csv(
     filepath: Path | str,
     sheet_name: Optional[str] = None,
@@ -140,6 +366,11 @@ def export_worksheet_to_csv(
     """
     Export an Excel worksheet to CSV format.
     
+    The plain CSV text is best suited to small sheets (up to ~64 KB). Results
+    sent over MCP or HTTP are JSON encoded, and escaping every quote and
+    newline in a large CSV is slow, so callers returning the content to a
+    client should use export_worksheet_to_csv_base64 instead.
+    
     Args:
         filepath: Path to the Excel file
         sheet_name: Name of worksheet to export (uses active sheet if None)
@@ -159,53 +390,11 @@ def export_worksheet_to_csv(
             raise FileOperationError(f"Excel file {filepath} does not exist")
             
         # Load workbook
-        wb = load_workbook(filepath, read_only=True)
-        
-        # Determine which sheet to export
-        if sheet_name is None:
-            sheet = wb.active
-            actual_sheet_name = sheet.title
-        elif sheet_name in wb.sheetnames:
-            sheet = wb[sheet_name]
-            actual_sheet_name = sheet_name
-        else:
-            raise FileOperationError(f"Sheet '{sheet_name}' not found in {filepath}")
-            
-        # Extract data from worksheet
-        data = []
-        for row in sheet.iter_rows(values_only=True):
-            # Skip empty rows (where all cells are None)
-            if any(cell is not None for cell in row):
-                data.append(row)
-                
-        if not data:
-            return {
-                "success": True,
-                "message": f"Exported empty sheet {actual_sheet_name} to CSV",
-                "csv_content": "",
-                "rows_exported": 0,
-                "sheet_name": actual_sheet_name,
-            }
-            
-        # Convert to CSV
-        import io
-        output = io.StringIO()
-        csv_writer = csv.writer(output, delimiter=delimiter)
-        
-        for row in data:
-            # Convert None values to empty strings
-            processed_row = ["" if cell is None else str(cell) for cell in row]
-            csv_writer.writerow(processed_row)
-            
-        csv_content = output.getvalue()
-        
-        return {
-            "success": True,
-            "message": f"Exported {actual_sheet_name} to CSV",
-            "csv_content": csv_content,
-            "rows_exported": len(data),
-            "sheet_name": actual_sheet_name,
-        }
+        wb = load_workbook(filepath, read_only=True, keep_links=False)
+        try:
+            return _ws_to_csv(wb, sheet_name, delimiter)
+        finally:
+            wb.close()
         
     except Exception as e:
         logger.error(f"Error exporting worksheet to CSV: {e}")
@@ -218,7 +407,8 @@ def import_csv_file_base64(
     sheet_name: Optional[str] = None,
     delimiter: str = ',',
     create_if_missing: bool = True,
-    merge_mode: str = 'replace'
+    merge_mode: str = 'replace',
+    csv_bytes: Optional[bytes] = None
 ) -> Dict[str, Any]:
     """
     Import a base64 encoded CSV file into Excel.
@@ -226,20 +416,22 @@ def import_csv_file_base64(
     Args:
         filepath: Path to the Excel file
         csv_content_base64: Base64 encoded CSV content
+        csv_bytes: Already decoded CSV content; when given, csv_content_base64
+            is ignored so callers that decoded at the edge don't pay twice
         Other args: Same as import_csv_to_excel
     
     Returns:
         Dict with result information
     """
     try:
-        # Decode base64 content
-        csv_bytes = base64.b64decode(csv_content_base64)
-        csv_content = csv_bytes.decode('utf-8')
+        # Decode base64 content; the UTF-8 text is decoded lazily on import
+        if csv_bytes is None:
+            csv_bytes = base64.b64decode(csv_content_base64)
         
         # Import the CSV content
-        return import_csv_to_excel(
+        return _import_csv_bytes(
             filepath, 
-            csv_content, 
+            csv_bytes, 
             sheet_name, 
             delimiter, 
             create_if_missing,
@@ -299,6 +491,7 @@ def bulk_import_csv_to_excel(
         filepath: Path to the Excel file
         csv_data_list: List of dictionaries containing CSV information:
             - csv_content: Content of the CSV file as a string
+            - csv_bytes: UTF-8 encoded CSV content (used instead of csv_content)
             - sheet_name: Name of worksheet to import into
             - delimiter: CSV delimiter character
             - merge_mode: How to handle existing data
@@ -314,35 +507,45 @@ def bulk_import_csv_to_excel(
         if isinstance(filepath, str):
             filepath = Path(filepath)
             
+        # Load the workbook once and apply every CSV before a single save.
+        # A new file whose CSVs all go to distinct, named sheets writes each
+        # sheet exactly once, so it can be created in write-only mode
+        sheet_targets = [csv_data.get("sheet_name") for csv_data in csv_data_list]
+        write_only = None not in sheet_targets and len(set(sheet_targets)) == len(sheet_targets)
+        wb = _load_or_create_workbook(filepath, create_if_missing, write_only=write_only)
+        sheet_names = set(wb.sheetnames)
+            
         # Process each CSV import
         for csv_data in csv_data_list:
+            sheet_name = csv_data.get("sheet_name")
             try:
-                csv_content = csv_data.get("csv_content", "")
-                sheet_name = csv_data.get("sheet_name")
-                delimiter = csv_data.get("delimiter", ",")
                 merge_mode = csv_data.get("merge_mode", "replace")
+                csv_bytes = csv_data.get("csv_bytes")
                 
                 # Import the CSV content
-                result = import_csv_to_excel(
-                    filepath,
-                    csv_content,
-                    sheet_name,
-                    delimiter,
-                    create_if_missing,
-                    merge_mode
-                )
+                if csv_bytes is not None:
+                    # Decoded incrementally while the rows are parsed and written
+                    csv_file = io.TextIOWrapper(io.BytesIO(csv_bytes), encoding='utf-8', newline='')
+                    csv_reader = csv.reader(csv_file, delimiter=csv_data.get("delimiter", ","))
+                    result = _apply_rows_to_workbook(wb, csv_reader, sheet_name, merge_mode, sheet_names)
+                else:
+                    result = _apply_csv_to_workbook(
+                        wb,
+                        csv_data.get("csv_content", ""),
+                        sheet_name,
+                        csv_data.get("delimiter", ","),
+                        merge_mode,
+                        sheet_names
+                    )
                 
                 results.append({
                     "success": True,
                     "sheet_name": result["sheet_name"],
                     "rows_imported": result["rows_imported"],
-                    "columns_imported": result.get("columns_imported", 0),
-                    "message": result["message"]
+                    "columns_imported": result["columns_imported"],
+                    "message": f"Imported CSV data to {result['sheet_name']} in {filepath.name}"
                 })
                 
-                # After first import, the file exists
-                create_if_missing = False
-                
             except Exception as e:
                 sheet_info = f" to sheet '{sheet_name}'" if sheet_name else ""
                 results.append({
@@ -350,6 +553,10 @@ def bulk_import_csv_to_excel(
                     "sheet_name": sheet_name,
                     "message": f"Failed to import CSV{sheet_info}: {str(e)}"
                 })
+        
+        # Save workbook once, if anything was imported
+        if any(result["success"] for result in results):
+            wb.save(filepath)
                 
         return results
         
@@ -369,6 +576,7 @@ def bulk_import_csv_file_base64(
         filepath: Path to the Excel file
         csv_data_list: List of dictionaries containing CSV information:
             - csv_content_base64: Base64 encoded content of the CSV file
+            - csv_bytes: Already decoded content (takes precedence over csv_content_base64)
             - sheet_name: Name of worksheet to import into
             - delimiter: CSV delimiter character
             - merge_mode: How to handle existing data
@@ -380,29 +588,27 @@ def bulk_import_csv_file_base64(
     decoded_data_list = []
     
     try:
-        # Decode each base64 CSV content
+        # Only the base64 layer is decoded up front. Each CSV is parsed and
+        # written one at a time, so no more than one is held as rows
         for csv_data in csv_data_list:
-            try:
-                csv_content_base64 = csv_data.get("csv_content_base64", "")
-                csv_bytes = base64.b64decode(csv_content_base64)
-                csv_content = csv_bytes.decode('utf-8')
-                
-                decoded_data = {
-                    "csv_content": csv_content,
-                    "sheet_name": csv_data.get("sheet_name"),
-                    "delimiter": csv_data.get("delimiter", ","),
-                    "merge_mode": csv_data.get("merge_mode", "replace")
-                }
-                
-                decoded_data_list.append(decoded_data)
-                
-            except Exception as e:
-                sheet_name = csv_data.get("sheet_name", "unknown")
-                return [{
-                    "success": False,
-                    "sheet_name": sheet_name,
-                    "message": f"Failed to decode base64 CSV for sheet '{sheet_name}': {str(e)}"
-                }]
+            csv_bytes = csv_data.get("csv_bytes")
+            if csv_bytes is None:
+                try:
+                    csv_bytes = base64.b64decode(csv_data.get("csv_content_base64", ""))
+                except Exception as e:
+                    sheet_name = csv_data.get("sheet_name", "unknown")
+                    return [{
+                        "success": False,
+                        "sheet_name": sheet_name,
+                        "message": f"Failed to decode base64 CSV for sheet '{sheet_name}': {str(e)}"
+                    }]
+            
+            decoded_data_list.append({
+                "csv_bytes": csv_bytes,
+                "sheet_name": csv_data.get("sheet_name"),
+                "delimiter": csv_data.get("delimiter", ","),
+                "merge_mode": csv_data.get("merge_mode", "replace")
+            })
         
         # Process the decoded CSV data
         return bulk_import_csv_to_excel(
@@ -417,7 +623,8 @@ def bulk_import_csv_file_base64(
 
 def bulk_export_worksheets_to_csv(
     filepath: Path | str,
-    worksheet_list: List[Dict[str, Any]]
+    worksheet_list: List[Dict[str, Any]],
+    as_base64: bool = False
 ) -> List[Dict[str, Any]]:
     """
     Export multiple Excel worksheets to CSV format.
@@ -428,6 +635,8 @@ def bulk_export_worksheets_to_csv(
             - sheet_name: Name of worksheet to export
             - delimiter: CSV delimiter character
             - include_header_row: Whether to treat the first row as headers
+        as_base64: Return base64 encoded CSV content (csv_content_base64)
+            instead of plain CSV content
     
     Returns:
         List of Dict with results for each export operation including CSV content
@@ -443,36 +652,46 @@ def bulk_export_worksheets_to_csv(
         if not filepath.exists():
             raise FileOperationError(f"Excel file {filepath} does not exist")
             
-        # Process each worksheet export
-        for worksheet_data in worksheet_list:
-            try:
-                sheet_name = worksheet_data.get("sheet_name")
-                delimiter = worksheet_data.get("delimiter", ",")
-                include_header_row = worksheet_data.get("include_header_row", True)
+        # Load the workbook once and serialize the sheets concurrently
+        wb = load_workbook(filepath, read_only=True, keep_links=False)
+        try:
+            results = [None] * len(worksheet_list)
+            max_workers = max(1, min(8, len(worksheet_list)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        _ws_to_csv,
+                        wb,
+                        worksheet_data.get("sheet_name"),
+                        worksheet_data.get("delimiter", ","),
+                        as_base64
+                    ): index
+                    for index, worksheet_data in enumerate(worksheet_list)
+                }
                 
-                # Export the worksheet to CSV
-                result = export_worksheet_to_csv(
-                    filepath,
-                    sheet_name,
-                    delimiter,
-                    include_header_row
-                )
-                
-                results.append({
-                    "success": True,
-                    "sheet_name": result["sheet_name"],
-                    "rows_exported": result["rows_exported"],
-                    "columns_exported": result.get("columns_exported", 0),
-                    "csv_content": result["csv_content"],
-                    "message": result["message"]
-                })
-                
-            except Exception as e:
-                results.append({
-                    "success": False,
-                    "sheet_name": sheet_name,
-                    "message": f"Failed to export worksheet '{sheet_name}' to CSV: {str(e)}"
-                })
+                # Collect results in the order the worksheets were requested
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        result = future.result()
+                        content_key = "csv_content_base64" if as_base64 else "csv_content"
+                        results[index] = {
+                            "success": True,
+                            "sheet_name": result["sheet_name"],
+                            "rows_exported": result["rows_exported"],
+                            "columns_exported": result.get("columns_exported", 0),
+                            content_key: result[content_key],
+                            "message": result["message"]
+                        }
+                    except Exception as e:
+                        sheet_name = worksheet_list[index].get("sheet_name")
+                        results[index] = {
+                            "success": False,
+                            "sheet_name": sheet_name,
+                            "message": f"Failed to export worksheet '{sheet_name}' to CSV: {str(e)}"
+                        }
+        finally:
+            wb.close()
                 
         return results
         
@@ -497,29 +716,107 @@ def bulk_export_worksheets_to_csv_base64(
     Returns:
         List of Dict with results for each export including base64 encoded CSV content
     """
-    results = []
-    
     try:
-        # Export the worksheets to CSV
-        csv_results = bulk_export_worksheets_to_csv(
+        # Each worker encodes its own sheet, so plain CSV never reaches this thread
+        return bulk_export_worksheets_to_csv(
             filepath,
-            worksheet_list
+            worksheet_list,
+            as_base64=True
         )
         
-        # Base64 encode each CSV content
-        for result in csv_results:
-            if result["success"]:
-                csv_bytes = result["csv_content"].encode('utf-8')
-                csv_content_base64 = base64.b64encode(csv_bytes).decode('utf-8')
-                
-                # Update result with base64 content and remove plain text content
-                result["csv_content_base64"] = csv_content_base64
-                del result["csv_content"]
-                
-            results.append(result)
-                
-        return results
-        
     except Exception as e:
         logger.error(f"Error in bulk worksheet base64 CSV export: {e}")
         raise FileOperationError(f"Failed to perform bulk worksheet base64 CSV export: {str(e)}")
+
+# Import results in the shape returned by the MCP tools and the web API
+def import_csv_result(
+    filepath: Path | str,
+    csv_content_base64: Optional[str],
+    sheet_name: Optional[str] = None,
+    delimiter: str = ',',
+    create_if_missing: bool = True,
+    merge_mode: str = 'replace',
+    csv_bytes: Optional[bytes] = None
+) -> Dict[str, Any]:
+    """
+    Import a base64 encoded CSV file, reporting failures in the result.
+    
+    Args: Same as import_csv_file_base64
+    
+    Returns:
+        Dict with a success flag, a message and the import details
+    """
+    try:
+        result = import_csv_file_base64(
+            filepath,
+            csv_content_base64,
+            sheet_name,
+            delimiter,
+            create_if_missing,
+            merge_mode,
+            csv_bytes=csv_bytes
+        )
+        
+        return {
+            "success": True,
+            "message": result["message"],
+            "rows_imported": result["rows_imported"],
+            "columns_imported": result.get("columns_imported", 0),
+            "sheet_name": result["sheet_name"],
+            "excel_path": result["filepath"]
+        }
+    except FileOperationError as e:
+        logger.error(f"Error importing CSV: {e}")
+        return {
+            "success": False,
+            "message": f"CSV import failed: {str(e)}"
+        }
+    except Exception as e:
+        logger.error(f"Unexpected error importing CSV: {e}")
+        return {
+            "success": False,
+            "message": f"Unexpected error during CSV import: {str(e)}"
+        }
+
+def bulk_import_csv_result(
+    filepath: Path | str,
+    csv_data_list: List[Dict[str, Any]],
+    create_if_missing: bool = True
+) -> Dict[str, Any]:
+    """
+    Import multiple base64 encoded CSV files, reporting failures in the result.
+    
+    Args: Same as bulk_import_csv_file_base64
+    
+    Returns:
+        Dict with a success flag, a summary message and the per-CSV results
+    """
+    try:
+        results = bulk_import_csv_file_base64(
+            filepath,
+            csv_data_list,
+            create_if_missing
+        )
+        
+        # Count successful imports
+        successful = sum(1 for result in results if result.get("success", False))
+        total = len(results)
+        
+        return {
+            "success": True,
+            "message": f"Processed {total} CSV imports ({successful} successful, {total - successful} failed)",
+            "results": results,
+            "excel_path": str(filepath)
+        }
+    except FileOperationError as e:
+        logger.error(f"Error in bulk CSV import: {e}")
+        return {
+            "success": False,
+            "message": f"Bulk CSV import failed: {str(e)}"
+        }
+    except Exception as e:
+        logger.error(f"Unexpected error in bulk CSV import: {e}")
+        return {
+            "success": False,
+            "message": f"Unexpected error during bulk CSV import: {str(e)}"
+        }
@@ -21,7 +21,9 @@ def read_excel_range(
 ) -> list[dict[str, Any]]:
     """Read data from Excel range with optional preview mode"""
     try:
-        wb = load_workbook(filepath, read_only=True)
+        # Read-only mode streams the sheet XML instead of building every cell.
+        # Formulas are kept (data_only=False) so formula text still reads back.
+        wb = load_workbook(filepath, read_only=True, keep_links=False)
         
         if sheet_name not in wb.sheetnames:
             raise DataError(f"Sheet '{sheet_name}' not found")
@@ -51,11 +53,22 @@ def read_excel_range(
             except ValueError as e:
                 raise DataError(f"Invalid end cell format: {str(e)}")
         else:
-            # Dynamically expand range until all values are empty
+            # Read from the start cell to the sheet bounds in one pass, then
+            # dynamically expand range until all values are empty
+            block = list(ws.iter_rows(
+                min_row=start_row, max_row=ws.max_row,
+                min_col=start_col, max_col=ws.max_column,
+                values_only=True
+            ))
             end_row, end_col = start_row, start_col
-            while end_row <= ws.max_row and any(ws.cell(row=end_row, column=c).value is not None for c in range(start_col, ws.max_column + 1)):
+            # tuple.count runs in C, unlike an any() generator per cell
+            for row_values in block:
+                if row_values.count(None) == len(row_values):
+                    break
                 end_row += 1
-            while end_col <= ws.max_column and any(ws.cell(row=r, column=end_col).value is not None for r in range(start_row, ws.max_row + 1)):
+            for col_values in zip(*block):
+                if col_values.count(None) == len(col_values):
+                    break
                 end_col += 1
             end_row -= 1  # Adjust back to last non-empty row
             end_col -= 1  # Adjust back to last non-empty column
@@ -68,13 +81,15 @@ def read_excel_range(
             )
 
         data = []
-        for row in range(start_row, end_row + 1):
-            row_data = []
-            for col in range(start_col, end_col + 1):
-                cell = ws.cell(row=row, column=col)
-                row_data.append(cell.value)
-            if any(v is not None for v in row_data):
-                data.append(row_data)
+        if end_row >= start_row and end_col >= start_col:
+            rows = ws.iter_rows(
+                min_row=start_row, max_row=end_row,
+                min_col=start_col, max_col=end_col,
+                values_only=True
+            )
+            for row_values in rows:
+                if row_values.count(None) != len(row_values):
+                    data.append(list(row_values))
 
         wb.close()
         return data
@@ -234,10 +249,17 @@ def _write_data_to_worksheet(
         except ValueError as e:
             raise DataError(f"Invalid start cell format: {str(e)}")
 
-        # Write data
-        for i, row in enumerate(data):
-            for j, val in enumerate(row):
-                worksheet.cell(row=start_row + i, column=start_col + j, value=val)
+        # Write data. When the block starts in column A directly below the
+        # existing data, append() writes whole rows without per-cell lookups.
+        # An empty sheet also reports max_row 1, so one-row sheets go per cell
+        if start_col == 1 and start_row > 2 and start_row == worksheet.max_row + 1:
+            for row in data:
+                worksheet.append(row)
+        else:
+            write_cell = worksheet.cell
+            for i, row in enumerate(data, start=start_row):
+                for j, val in enumerate(row, start=start_col):
+                    write_cell(row=i, column=j, value=val)
     except DataError as e:
         logger.error(str(e))
         raise
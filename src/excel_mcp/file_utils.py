@@ -0,0 +1,21 @@
+"""Formatting helpers for file listings, shared by the MCP tools and the web interface."""
+
+import time
+
+# Helper function for formatting file timestamps
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+def format_timestamp(timestamp: float) -> str:
+    """Format a file timestamp in local time without building a datetime."""
+    return time.strftime(_TIMESTAMP_FORMAT, time.localtime(timestamp))
+
+# Helper function for formatting file sizes
+_SIZE_UNITS = ("B", "KB", "MB", "GB")
+
+def format_size(size_bytes):
+    """Format file size in a human-readable format."""
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+    # Each unit is 2**10 of the previous one, so bit_length picks it directly
+    unit = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit)):.2f} {_SIZE_UNITS[unit]}"
@@ -1,13 +1,24 @@
+import asyncio
+import functools
+import json
 import logging
 import sys
 import os
 import time
-import base64
-from datetime import datetime
+import binascii
+import errno
+import mmap
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, List, Dict, Optional
 
 from mcp.server.fastmcp import FastMCP
+from openpyxl import load_workbook
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
 
 # Import exceptions
 from excel_mcp.exceptions import (
@@ -27,9 +38,15 @@ from excel_mcp.validation import (
     validate_formula_in_cell_operation as validate_formula_impl,
     validate_range_in_sheet_operation as validate_range_impl
 )
+from excel_mcp.calculations import apply_formula as apply_formula_impl
 from excel_mcp.chart import create_chart_in_sheet as create_chart_impl
-from excel_mcp.workbook import get_workbook_info
-from excel_mcp.data import write_data
+from excel_mcp.formatting import format_range as format_range_func
+from excel_mcp.workbook import (
+    get_workbook_info,
+    create_workbook as create_workbook_impl,
+    create_sheet as create_worksheet_impl,
+)
+from excel_mcp.data import read_excel_range, write_data
 from excel_mcp.pivot import create_pivot_table as create_pivot_table_impl
 from excel_mcp.sheet import (
     copy_sheet,
@@ -37,13 +54,16 @@ from excel_mcp.sheet import (
     rename_sheet,
     merge_range,
     unmerge_range,
+    copy_range_operation,
+    delete_range_operation,
 )
 from excel_mcp.csv_operations import (
-    import_csv_file_base64,
+    import_csv_result,
     export_worksheet_to_csv_base64,
-    bulk_import_csv_file_base64,
+    bulk_import_csv_result,
     bulk_export_worksheets_to_csv_base64
 )
+from excel_mcp.file_utils import format_size, format_timestamp
 
 # Configure logging
 logging.basicConfig(
@@ -58,12 +78,51 @@ logging.basicConfig(
 
 logger = logging.getLogger("excel-mcp")
 
+def tool_guard(*error_types: type[Exception], action: str):
+    """Wrap a tool so the expected error types come back as "Error: ..." strings.
+
+    Anything else is logged as "Error <action>: ..." and re-raised for FastMCP to report.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except error_types as e:
+                return f"Error: {str(e)}"
+            except Exception as e:
+                logger.error(f"Error {action}: {e}")
+                raise
+        return wrapper
+    return decorator
+
+def _json_default(value: Any) -> str:
+    """Serialize cell values JSON has no type for (dates, times, decimals)."""
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+def _dumps(value: Any) -> str:
+    """Serialize a tool result to a JSON string, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(value, default=_json_default).decode()
+    return json.dumps(value, default=_json_default, ensure_ascii=False, separators=(",", ":"))
+
 # Get Excel files path from environment or use default
 EXCEL_FILES_PATH = os.environ.get("EXCEL_FILES_PATH", "./excel_files")
 
 # Create the directory if it doesn't exist
 os.makedirs(EXCEL_FILES_PATH, exist_ok=True)
 
+# Resolved once; every tool call maps its filename onto this root
+_EXCEL_ROOT = os.path.abspath(EXCEL_FILES_PATH)
+_EXCEL_ROOT_PREFIX = _EXCEL_ROOT + os.sep
+
+# Uploads are decoded in slices of this many base64 characters. It is a
+# multiple of 4 so every slice decodes on its own.
+UPLOAD_DECODE_CHUNK = 3 * 64 * 1024
+
+# Largest file upload_file accepts, checked before anything is decoded
+MAX_UPLOAD_BYTES = int(os.environ.get("EXCEL_MCP_MAX_UPLOAD", 256 * 1024 * 1024))
+
 # Initialize FastMCP server
 mcp = FastMCP(
     "excel-mcp",
@@ -75,6 +134,11 @@ mcp = FastMCP(
             "description": "Path to Excel files directory",
             "required": False,
             "default": EXCEL_FILES_PATH
+        },
+        "EXCEL_MCP_MAX_UPLOAD": {
+            "description": "Maximum size in bytes of a file accepted by upload_file",
+            "required": False,
+            "default": str(MAX_UPLOAD_BYTES)
         }
     }
 )
@@ -87,15 +151,22 @@ def get_excel_path(filename: str) -> str:
         
     Returns:
         Full path to Excel file
+
+    Raises:
+        ValidationError: If a relative filename escapes the Excel files directory
     """
     # If filename is already an absolute path, return it
     if os.path.isabs(filename):
         return filename
         
     # Use the configured Excel files path
-    return os.path.join(EXCEL_FILES_PATH, filename)
+    path = _EXCEL_ROOT_PREFIX + filename
+    if ".." in filename and os.path.commonpath([_EXCEL_ROOT, os.path.normpath(path)]) != _EXCEL_ROOT:
+        raise ValidationError(f"Path escapes the Excel files directory: {filename}")
+    return path
 
 @mcp.tool()
+@tool_guard(ValidationError, CalculationError, FileNotFoundError, action="applying formula")
 def apply_formula(
     filepath: str,
     sheet_name: str,
@@ -106,24 +177,21 @@ def apply_formula(
     Apply Excel formula to cell.
     Excel formula will write to cell with verification.
     """
-    try:
-        full_path = get_excel_path(filepath)
-        # First validate the formula
-        validation = validate_formula_impl(full_path, sheet_name, cell, formula)
-        if isinstance(validation, dict) and "error" in validation:
-            return f"Error: {validation['error']}"
-            
-        # If valid, apply the formula
-        from excel_mcp.calculations import apply_formula as apply_formula_impl
-        result = apply_formula_impl(full_path, sheet_name, cell, formula)
-        return result["message"]
-    except (ValidationError, CalculationError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error applying formula: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    # Validate and apply against the same open workbook
+    wb = load_workbook(full_path)
+
+    # First validate the formula
+    validation = validate_formula_impl(full_path, sheet_name, cell, formula, wb=wb)
+    if isinstance(validation, dict) and "error" in validation:
+        return f"Error: {validation['error']}"
+
+    # If valid, apply the formula
+    result = apply_formula_impl(full_path, sheet_name, cell, formula, wb=wb)
+    return result["message"]
 
 @mcp.tool()
+@tool_guard(ValidationError, CalculationError, action="validating formula")
 def validate_formula_syntax(
     filepath: str,
     sheet_name: str,
@@ -131,17 +199,12 @@ def validate_formula_syntax(
     formula: str,
 ) -> str:
     """Validate Excel formula syntax without applying it."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = validate_formula_impl(full_path, sheet_name, cell, formula)
-        return result["message"]
-    except (ValidationError, CalculationError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error validating formula: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = validate_formula_impl(full_path, sheet_name, cell, formula)
+    return result["message"]
 
 @mcp.tool()
+@tool_guard(ValidationError, FormattingError, action="formatting range")
 def format_range(
     filepath: str,
     sheet_name: str,
@@ -163,38 +226,32 @@ def format_range(
     conditional_format: Dict[str, Any] = None
 ) -> str:
     """Apply formatting to a range of cells."""
-    try:
-        full_path = get_excel_path(filepath)
-        from excel_mcp.formatting import format_range as format_range_func
-        
-        result = format_range_func(
-            filepath=full_path,
-            sheet_name=sheet_name,
-            start_cell=start_cell,
-            end_cell=end_cell,
-            bold=bold,
-            italic=italic,
-            underline=underline,
-            font_size=font_size,
-            font_color=font_color,
-            bg_color=bg_color,
-            border_style=border_style,
-            border_color=border_color,
-            number_format=number_format,
-            alignment=alignment,
-            wrap_text=wrap_text,
-            merge_cells=merge_cells,
-            protection=protection,
-            conditional_format=conditional_format
-        )
-        return "Range formatted successfully"
-    except (ValidationError, FormattingError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error formatting range: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+
+    result = format_range_func(
+        filepath=full_path,
+        sheet_name=sheet_name,
+        start_cell=start_cell,
+        end_cell=end_cell,
+        bold=bold,
+        italic=italic,
+        underline=underline,
+        font_size=font_size,
+        font_color=font_color,
+        bg_color=bg_color,
+        border_style=border_style,
+        border_color=border_color,
+        number_format=number_format,
+        alignment=alignment,
+        wrap_text=wrap_text,
+        merge_cells=merge_cells,
+        protection=protection,
+        conditional_format=conditional_format
+    )
+    return "Range formatted successfully"
 
 @mcp.tool()
+@tool_guard(action="reading data")
 def read_data_from_excel(
     filepath: str,
     sheet_name: str,
@@ -206,22 +263,16 @@ def read_data_from_excel(
     Read data from Excel worksheet.
     
     Returns:  
-    Data from Excel worksheet as json string. list of lists or empty list if no data found. sublists are assumed to be rows.
+    Data from Excel worksheet as a JSON array of rows (each row a JSON array of cell values).
     """
-    try:
-        full_path = get_excel_path(filepath)
-        from excel_mcp.data import read_excel_range
-        result = read_excel_range(full_path, sheet_name, start_cell, end_cell, preview_only)
-        if not result:
-            return "No data found in specified range"
-        # Convert the list of dicts to a formatted string
-        data_str = "\n".join([str(row) for row in result])
-        return data_str
-    except Exception as e:
-        logger.error(f"Error reading data: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = read_excel_range(full_path, sheet_name, start_cell, end_cell, preview_only)
+    if not result:
+        return "No data found in specified range"
+    return _dumps(result)
 
 @mcp.tool()
+@tool_guard(ValidationError, DataError, action="writing data")
 def write_data_to_excel(
     filepath: str,
     sheet_name: str,
@@ -239,45 +290,28 @@ def write_data_to_excel(
     start_cell: Cell to start writing to, default is "A1"
   
     """
-    try:
-        full_path = get_excel_path(filepath)
-        result = write_data(full_path, sheet_name, data, start_cell)
-        return result["message"]
-    except (ValidationError, DataError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error writing data: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = write_data(full_path, sheet_name, data, start_cell)
+    return result["message"]
 
 @mcp.tool()
+@tool_guard(WorkbookError, action="creating workbook")
 def create_workbook(filepath: str) -> str:
     """Create new Excel workbook."""
-    try:
-        full_path = get_excel_path(filepath)
-        from excel_mcp.workbook import create_workbook as create_workbook_impl
-        result = create_workbook_impl(full_path)
-        return f"Created workbook at {full_path}"
-    except WorkbookError as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error creating workbook: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = create_workbook_impl(full_path)
+    return f"Created workbook at {full_path}"
 
 @mcp.tool()
+@tool_guard(ValidationError, WorkbookError, action="creating worksheet")
 def create_worksheet(filepath: str, sheet_name: str) -> str:
     """Create new worksheet in workbook."""
-    try:
-        full_path = get_excel_path(filepath)
-        from excel_mcp.workbook import create_sheet as create_worksheet_impl
-        result = create_worksheet_impl(full_path, sheet_name)
-        return result["message"]
-    except (ValidationError, WorkbookError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error creating worksheet: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = create_worksheet_impl(full_path, sheet_name)
+    return result["message"]
 
 @mcp.tool()
+@tool_guard(ValidationError, ChartError, action="creating chart")
 def create_chart(
     filepath: str,
     sheet_name: str,
@@ -289,26 +323,21 @@ def create_chart(
     y_axis: str = ""
 ) -> str:
     """Create chart in worksheet."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = create_chart_impl(
-            filepath=full_path,
-            sheet_name=sheet_name,
-            data_range=data_range,
-            chart_type=chart_type,
-            target_cell=target_cell,
-            title=title,
-            x_axis=x_axis,
-            y_axis=y_axis
-        )
-        return result["message"]
-    except (ValidationError, ChartError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error creating chart: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = create_chart_impl(
+        filepath=full_path,
+        sheet_name=sheet_name,
+        data_range=data_range,
+        chart_type=chart_type,
+        target_cell=target_cell,
+        title=title,
+        x_axis=x_axis,
+        y_axis=y_axis
+    )
+    return result["message"]
 
 @mcp.tool()
+@tool_guard(ValidationError, PivotError, action="creating pivot table")
 def create_pivot_table(
     filepath: str,
     sheet_name: str,
@@ -319,117 +348,82 @@ def create_pivot_table(
     agg_func: str = "mean"
 ) -> str:
     """Create pivot table in worksheet."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = create_pivot_table_impl(
-            filepath=full_path,
-            sheet_name=sheet_name,
-            data_range=data_range,
-            rows=rows,
-            values=values,
-            columns=columns or [],
-            agg_func=agg_func
-        )
-        return result["message"]
-    except (ValidationError, PivotError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error creating pivot table: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = create_pivot_table_impl(
+        filepath=full_path,
+        sheet_name=sheet_name,
+        data_range=data_range,
+        rows=rows,
+        values=values,
+        columns=columns or [],
+        agg_func=agg_func
+    )
+    return result["message"]
 
 @mcp.tool()
+@tool_guard(ValidationError, SheetError, action="copying worksheet")
 def copy_worksheet(
     filepath: str,
     source_sheet: str,
     target_sheet: str
 ) -> str:
     """Copy worksheet within workbook."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = copy_sheet(full_path, source_sheet, target_sheet)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error copying worksheet: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = copy_sheet(full_path, source_sheet, target_sheet)
+    return result["message"]
 
 @mcp.tool()
+@tool_guard(ValidationError, SheetError, action="deleting worksheet")
 def delete_worksheet(
     filepath: str,
     sheet_name: str
 ) -> str:
     """Delete worksheet from workbook."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = delete_sheet(full_path, sheet_name)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error deleting worksheet: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = delete_sheet(full_path, sheet_name)
+    return result["message"]
 
 @mcp.tool()
+@tool_guard(ValidationError, SheetError, action="renaming worksheet")
 def rename_worksheet(
     filepath: str,
     old_name: str,
     new_name: str
 ) -> str:
     """Rename worksheet in workbook."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = rename_sheet(full_path, old_name, new_name)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error renaming worksheet: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = rename_sheet(full_path, old_name, new_name)
+    return result["message"]
 
 @mcp.tool()
+@tool_guard(WorkbookError, action="getting workbook metadata")
 def get_workbook_metadata(
     filepath: str,
     include_ranges: bool = False
 ) -> str:
-    """Get metadata about workbook including sheets, ranges, etc."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = get_workbook_info(full_path, include_ranges=include_ranges)
-        return str(result)
-    except WorkbookError as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error getting workbook metadata: {e}")
-        raise
+    """Get metadata about workbook including sheets, ranges, etc. as a JSON object."""
+    full_path = get_excel_path(filepath)
+    result = get_workbook_info(full_path, include_ranges=include_ranges)
+    return _dumps(result)
 
 @mcp.tool()
+@tool_guard(ValidationError, SheetError, action="merging cells")
 def merge_cells(filepath: str, sheet_name: str, start_cell: str, end_cell: str) -> str:
     """Merge a range of cells."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = merge_range(full_path, sheet_name, start_cell, end_cell)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error merging cells: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = merge_range(full_path, sheet_name, start_cell, end_cell)
+    return result["message"]
 
 @mcp.tool()
+@tool_guard(ValidationError, SheetError, action="unmerging cells")
 def unmerge_cells(filepath: str, sheet_name: str, start_cell: str, end_cell: str) -> str:
     """Unmerge a range of cells."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = unmerge_range(full_path, sheet_name, start_cell, end_cell)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error unmerging cells: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = unmerge_range(full_path, sheet_name, start_cell, end_cell)
+    return result["message"]
 
 @mcp.tool()
+@tool_guard(ValidationError, SheetError, action="copying range")
 def copy_range(
     filepath: str,
     sheet_name: str,
@@ -439,25 +433,19 @@ def copy_range(
     target_sheet: str = None
 ) -> str:
     """Copy a range of cells to another location."""
-    try:
-        full_path = get_excel_path(filepath)
-        from excel_mcp.sheet import copy_range_operation
-        result = copy_range_operation(
-            full_path,
-            sheet_name,
-            source_start,
-            source_end,
-            target_start,
-            target_sheet
-        )
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error copying range: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = copy_range_operation(
+        full_path,
+        sheet_name,
+        source_start,
+        source_end,
+        target_start,
+        target_sheet
+    )
+    return result["message"]
 
 @mcp.tool()
+@tool_guard(ValidationError, SheetError, action="deleting range")
 def delete_range(
     filepath: str,
     sheet_name: str,
@@ -466,24 +454,18 @@ def delete_range(
     shift_direction: str = "up"
 ) -> str:
     """Delete a range of cells and shift remaining cells."""
-    try:
-        full_path = get_excel_path(filepath)
-        from excel_mcp.sheet import delete_range_operation
-        result = delete_range_operation(
-            full_path,
-            sheet_name,
-            start_cell,
-            end_cell,
-            shift_direction
-        )
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error deleting range: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    result = delete_range_operation(
+        full_path,
+        sheet_name,
+        start_cell,
+        end_cell,
+        shift_direction
+    )
+    return result["message"]
 
 @mcp.tool()
+@tool_guard(ValidationError, action="validating range")
 def validate_excel_range(
     filepath: str,
     sheet_name: str,
@@ -491,34 +473,16 @@ def validate_excel_range(
     end_cell: str = None
 ) -> str:
     """Validate if a range exists and is properly formatted."""
-    try:
-        full_path = get_excel_path(filepath)
-        range_str = start_cell if not end_cell else f"{start_cell}:{end_cell}"
-        result = validate_range_impl(full_path, sheet_name, range_str)
-        return result["message"]
-    except ValidationError as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error validating range: {e}")
-        raise
+    full_path = get_excel_path(filepath)
+    range_str = start_cell if not end_cell else f"{start_cell}:{end_cell}"
+    result = validate_range_impl(full_path, sheet_name, range_str)
+    return result["message"]
 
 @mcp.tool()
 def health_check():
     """Health check endpoint for the MCP server."""
     return {"status": "healthy", "timestamp": time.time(), "service": "mcp-server"}
 
-# Helper function for formatting file sizes
-def format_size(size_bytes):
-    """Format file size in a human-readable format."""
-    if size_bytes < 1024:
-        return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.2f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.2f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
-
 @mcp.tool()
 def list_excel_files() -> Dict[str, Any]:
     """
@@ -531,22 +495,27 @@ def list_excel_files() -> Dict[str, Any]:
             files_path.mkdir(parents=True, exist_ok=True)
             
         files_info = []
-        for file_path in files_path.glob("*.xls*"):  # Match both .xls and .xlsx
-            if file_path.is_file():
-                stats = file_path.stat()
+        # One scandir pass; DirEntry caches the file type, so only stat() hits the disk
+        with os.scandir(files_path) as entries:
+            for entry in entries:
+                # Match both .xls and .xlsx; skip hidden files as glob did
+                if ".xls" not in entry.name or entry.name.startswith(".") or not entry.is_file():
+                    continue
+                stats = entry.stat()
                 files_info.append({
-                    "name": file_path.name,
-                    "path": str(file_path),
+                    "name": entry.name,
+                    "path": entry.path,
                     "size": stats.st_size,
                     "size_formatted": format_size(stats.st_size),
-                    "modified": datetime.fromtimestamp(stats.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
-                    "created": datetime.fromtimestamp(stats.st_ctime).strftime("%Y-%m-%d %H:%M:%S")
+                    "modified": format_timestamp(stats.st_mtime),
+                    "created": format_timestamp(stats.st_ctime)
                 })
         
         # Sort files alphabetically by name
+        files_info.sort(key=itemgetter("name"))
         return {
             "success": True,
-            "files": sorted(files_info, key=lambda x: x["name"]),
+            "files": files_info,
             "message": f"Found {len(files_info)} Excel files"
         }
     except Exception as e:
@@ -557,35 +526,73 @@ def list_excel_files() -> Dict[str, Any]:
             "message": f"Failed to list files: {str(e)}"
         }
 
-@mcp.tool()
-def upload_file(filename: str, file_content_base64: str) -> Dict[str, Any]:
-    """
-    Upload an Excel file to the server using base64 encoding.
-    
-    Args:
-        filename: Name of the file to create
-        file_content_base64: Base64 encoded file content
-        
-    Returns:
-        Dictionary with upload status information
-    """
+def _preallocate(fd: int, size: int) -> None:
+    """Reserve disk space for an upload up front so it is laid out contiguously."""
+    if not hasattr(os, "posix_fallocate") or size <= 0:
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError as e:
+        # Only a full disk matters; some filesystems don't support fallocate
+        if e.errno == errno.ENOSPC:
+            raise
+
+def _drop_from_page_cache(fd: int) -> None:
+    """Hint that a just-written upload needn't stay cached, sparing hot workbook pages."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            # DONTNEED skips dirty pages, so write them back first
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+def _upload_file(filename: str, file_content_base64: str) -> Dict[str, Any]:
+    """Blocking implementation of the upload_file tool."""
     if not filename.lower().endswith(('.xlsx', '.xls')):
         return {
             "success": False,
             "message": "Invalid file extension. Only .xlsx and .xls files are supported."
         }
     
+    # Clients may wrap base64 at 76 columns; drop the whitespace so slices stay
+    # aligned and the size estimate below counts only base64 characters
+    content = file_content_base64.strip()
+    if any(ws in content for ws in ("\n", "\r", " ", "\t")):
+        content = "".join(content.split())
+    
+    # Every 4 base64 characters decode to 3 bytes, less any trailing padding
+    decoded_size = len(content) // 4 * 3 - content.count("=", -2)
+    if decoded_size > MAX_UPLOAD_BYTES:
+        return {
+            "success": False,
+            "message": f"File too large. Maximum upload size is {format_size(MAX_UPLOAD_BYTES)}."
+        }
+    
     try:
-        # Decode base64 content
-        file_content = base64.b64decode(file_content_base64)
-        
+        if len(content) % 4:
+            raise ValueError("Invalid base64 content: length is not a multiple of 4")
+
         # Create target directory if it doesn't exist
         os.makedirs(EXCEL_FILES_PATH, exist_ok=True)
-        
-        # Save file
+
+        # Decode slice by slice into a hidden temporary file so a bad payload
+        # never replaces an existing workbook and listings never show it
         file_path = Path(EXCEL_FILES_PATH) / filename
-        with open(file_path, "wb") as f:
-            f.write(file_content)
+        part_path = file_path.with_name("." + file_path.name + ".part")
+        try:
+            with open(part_path, "wb") as f:
+                _preallocate(f.fileno(), len(content) // 4 * 3)
+                for i in range(0, len(content), UPLOAD_DECODE_CHUNK):
+                    f.write(binascii.a2b_base64(content[i:i + UPLOAD_DECODE_CHUNK]))
+                # Padding (and any skipped junk) makes the estimate slightly long
+                f.truncate()
+                f.flush()
+                _drop_from_page_cache(f.fileno())
+            os.replace(part_path, file_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
             
         file_size = file_path.stat().st_size
             
@@ -604,16 +611,23 @@ def upload_file(filename: str, file_content_base64: str) -> Dict[str, Any]:
         }
 
 @mcp.tool()
-def download_file(filename: str) -> Dict[str, Any]:
+async def upload_file(filename: str, file_content_base64: str) -> Dict[str, Any]:
     """
-    Download an Excel file from the server as base64 encoded content.
+    Upload an Excel file to the server using base64 encoding.
     
     Args:
-        filename: Name of the file to download
+        filename: Name of the file to create
+        file_content_base64: Base64 encoded file content
         
     Returns:
-        Dictionary with file content (base64 encoded) and metadata
+        Dictionary with upload status information
     """
+    # Decoding and disk IO run in a worker thread so large uploads don't
+    # block the event loop serving other tool calls
+    return await asyncio.to_thread(_upload_file, filename, file_content_base64)
+
+def _download_file(filename: str) -> Dict[str, Any]:
+    """Blocking implementation of the download_file tool."""
     try:
         file_path = Path(EXCEL_FILES_PATH) / filename
         
@@ -623,21 +637,23 @@ def download_file(filename: str) -> Dict[str, Any]:
                 "message": f"File {filename} not found"
             }
         
-        # Read file content
+        # Encode straight from a memory map instead of reading a copy first
         with open(file_path, "rb") as f:
-            file_content = f.read()
-        
-        # Get file stats
-        stats = file_path.stat()
+            stats = os.fstat(f.fileno())
+            if stats.st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content_base64 = binascii.b2a_base64(mm, newline=False).decode('ascii')
+            else:
+                content_base64 = ""
         
         return {
             "success": True,
             "filename": filename,
-            "content_base64": base64.b64encode(file_content).decode('utf-8'),
+            "content_base64": content_base64,
             "size": stats.st_size,
             "size_formatted": format_size(stats.st_size),
-            "modified": datetime.fromtimestamp(stats.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
-            "created": datetime.fromtimestamp(stats.st_ctime).strftime("%Y-%m-%d %H:%M:%S"),
+            "modified": format_timestamp(stats.st_mtime),
+            "created": format_timestamp(stats.st_ctime),
             "message": f"Downloaded {filename} ({format_size(stats.st_size)})"
         }
     except Exception as e:
@@ -647,6 +663,20 @@ def download_file(filename: str) -> Dict[str, Any]:
             "message": f"Failed to download file: {str(e)}"
         }
 
+@mcp.tool()
+async def download_file(filename: str) -> Dict[str, Any]:
+    """
+    Download an Excel file from the server as base64 encoded content.
+    
+    Args:
+        filename: Name of the file to download
+        
+    Returns:
+        Dictionary with file content (base64 encoded) and metadata
+    """
+    # Reading and encoding run in a worker thread, as for upload_file
+    return await asyncio.to_thread(_download_file, filename)
+
 @mcp.tool()
 def delete_excel_file(filename: str) -> Dict[str, Any]:
     """
@@ -706,37 +736,19 @@ def import_csv(
     """
     try:
         excel_path = get_excel_path(excel_filename)
-        
-        # Import the CSV
-        result = import_csv_file_base64(
-            excel_path,
-            csv_content_base64,
-            sheet_name,
-            delimiter,
-            create_if_missing,
-            merge_mode
-        )
-        
-        return {
-            "success": True,
-            "message": result["message"],
-            "rows_imported": result["rows_imported"],
-            "columns_imported": result.get("columns_imported", 0),
-            "sheet_name": result["sheet_name"],
-            "excel_path": result["filepath"]
-        }
-    except FileOperationError as e:
-        logger.error(f"Error importing CSV: {e}")
+    except ValidationError as e:
         return {
             "success": False,
             "message": f"CSV import failed: {str(e)}"
         }
-    except Exception as e:
-        logger.error(f"Unexpected error importing CSV: {e}")
-        return {
-            "success": False,
-            "message": f"Unexpected error during CSV import: {str(e)}"
-        }
+    return import_csv_result(
+        excel_path,
+        csv_content_base64,
+        sheet_name,
+        delimiter,
+        create_if_missing,
+        merge_mode
+    )
 
 @mcp.tool()
 def export_worksheet_to_csv(
@@ -811,36 +823,12 @@ def bulk_import_csv(
     """
     try:
         excel_path = get_excel_path(excel_filename)
-        
-        # Import the CSV files
-        results = bulk_import_csv_file_base64(
-            excel_path,
-            csv_data_list,
-            create_if_missing
-        )
-        
-        # Count successful imports
-        successful = sum(1 for result in results if result.get("success", False))
-        total = len(results)
-        
-        return {
-            "success": True,
-            "message": f"Processed {total} CSV imports ({successful} successful, {total - successful} failed)",
-            "results": results,
-            "excel_path": str(excel_path)
-        }
-    except FileOperationError as e:
-        logger.error(f"Error in bulk CSV import: {e}")
+    except ValidationError as e:
         return {
             "success": False,
             "message": f"Bulk CSV import failed: {str(e)}"
         }
-    except Exception as e:
-        logger.error(f"Unexpected error in bulk CSV import: {e}")
-        return {
-            "success": False,
-            "message": f"Unexpected error during bulk CSV import: {str(e)}"
-        }
+    return bulk_import_csv_result(excel_path, csv_data_list, create_if_missing)
 
 @mcp.tool()
 def bulk_export_worksheets_to_csv(
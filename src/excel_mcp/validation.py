@@ -2,7 +2,7 @@ import logging
 import re
 from typing import Any
 
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 
@@ -15,11 +15,17 @@ def validate_formula_in_cell_operation(
     filepath: str,
     sheet_name: str,
     cell: str,
-    formula: str
+    formula: str,
+    wb: Workbook | None = None
 ) -> dict[str, Any]:
-    """Validate Excel formula before writing"""
+    """Validate Excel formula before writing
+
+    Pass an already open workbook as wb to validate against it instead of
+    loading filepath.
+    """
     try:
-        wb = load_workbook(filepath)
+        if wb is None:
+            wb = load_workbook(filepath)
         if sheet_name not in wb.sheetnames:
             raise ValidationError(f"Sheet '{sheet_name}' not found")
 
@@ -1,176 +1,335 @@
 """Web interface and API for Excel MCP Server."""
 
+import asyncio
+import base64
+import binascii
+import functools
 import os
+import re
+import stat
 import time
-from datetime import datetime
+from contextlib import asynccontextmanager
+from datetime import timezone
+from email.utils import formatdate, parsedate_to_datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 from fastapi import FastAPI, UploadFile, File, HTTPException, Request, Form, Depends
-from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
-from excel_mcp.server import get_excel_path, EXCEL_FILES_PATH
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
+from excel_mcp.server import (
+    EXCEL_FILES_PATH,
+    export_worksheet_to_csv,
+    bulk_export_worksheets_to_csv,
+)
+from excel_mcp.csv_operations import import_csv_result, bulk_import_csv_result
+from excel_mcp.file_utils import format_size, format_timestamp
 from excel_mcp.workbook import get_workbook_info as get_info_impl
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Create the Excel files directory once at startup, instead of per request."""
+    os.makedirs(EXCEL_FILES_PATH, exist_ok=True)
+    yield
+
 # Create the FastAPI app - module-level variable
 app = FastAPI(
     title="Excel MCP Server",
     description="Web UI and API for Excel MCP Server",
     version="0.1.0",
+    lifespan=_lifespan,
 )
 
 # Export app for external imports
 __all__ = ["app"]
 
+# Serialize large JSON payloads with orjson when the speedups extra is installed
+FastJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+# Resolved once; every handler maps its filename onto this root via _safe().
+# abspath rather than resolve(), matching server.get_excel_path.
+_ROOT = Path(os.path.abspath(EXCEL_FILES_PATH))
+_ROOT_PREFIX = str(_ROOT) + os.sep
+
+# Uploads are copied to disk this many bytes at a time
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Last directory listing, reused while the directory's mtime is unchanged.
+# Saving a workbook in place doesn't touch the directory, so entries also
+# expire after FILES_CACHE_TTL seconds to pick up new sizes and times.
+FILES_CACHE_TTL = 5.0
+_FILES_CACHE: Dict[str, Any] = {"mtime": None, "expires": 0.0, "value": None}
+
 # Set up templates and static files
 current_dir = Path(__file__).parent
 templates = Jinja2Templates(directory=str(current_dir / "templates"))
-app.mount("/static", StaticFiles(directory=str(current_dir / "static")), name="static")
+# Page templates are loaded once and rendered directly, skipping the loader lookup per request
+_INDEX_TEMPLATE = templates.get_template("index.html")
+_FILES_TEMPLATE = templates.get_template("files.html")
+
+# Assets with a content hash in their name (main.3f2a9c1d.js) never change in
+# place, so browsers may keep them forever. The unhashed assets shipped today
+# get a short max-age instead, so an upgrade is picked up within the hour.
+_HASHED_ASSET = re.compile(r"\.[0-9a-f]{8,}\.(?:js|css)$")
+STATIC_MAX_AGE = 3600
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that tells browsers how long they may reuse each asset."""
+
+    async def get_response(self, path: str, scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            if _HASHED_ASSET.search(path):
+                response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+            else:
+                response.headers["Cache-Control"] = f"public, max-age={STATIC_MAX_AGE}"
+        return response
+
+app.mount("/static", CachedStaticFiles(directory=str(current_dir / "static")), name="static")
+
+# Request and response models are never mutated after validation; freezing
+# them skips assignment handling, and unknown fields are rejected up front
+_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid")
 
 class FileInfo(BaseModel):
     """Model for Excel file information."""
+    model_config = _MODEL_CONFIG
     name: str
     path: str
     size: int
     size_formatted: str
     modified: str
     created: str
-    
-def format_size(size_bytes):
-    """Format file size in a human-readable format."""
-    if size_bytes < 1024:
-        return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.2f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.2f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+
+def _safe(filename: str) -> str:
+    """Path of filename inside the Excel files directory; traversal outside it is a 400."""
+    path = os.path.normpath(_ROOT_PREFIX + filename)
+    if not path.startswith(_ROOT_PREFIX):
+        raise HTTPException(status_code=400, detail=f"Invalid filename: {filename}")
+    return path
+
+def invalidate_files_cache() -> None:
+    """Force the next get_excel_files() call to rescan the directory."""
+    _FILES_CACHE["mtime"] = None
 
 def get_excel_files() -> List[FileInfo]:
     """Get a list of all Excel files in the configured directory."""
-    files_path = Path(EXCEL_FILES_PATH)
-    if not files_path.exists():
-        files_path.mkdir(parents=True, exist_ok=True)
+    files_path = _ROOT
+    dir_mtime = os.stat(files_path).st_mtime_ns
+    now = time.monotonic()
+    if _FILES_CACHE["mtime"] == dir_mtime and now < _FILES_CACHE["expires"]:
+        return _FILES_CACHE["value"]
         
-    files_info = []
-    for file_path in files_path.glob("*.xls*"):  # Match both .xls and .xlsx
-        if file_path.is_file():
-            stats = file_path.stat()
-            files_info.append(FileInfo(
-                name=file_path.name,
-                path=str(file_path),
+    rows = []
+    # One scandir pass; DirEntry caches the file type, so only stat() hits the disk
+    with os.scandir(files_path) as entries:
+        for entry in entries:
+            # Match both .xls and .xlsx; skip hidden files as glob did
+            if ".xls" not in entry.name or entry.name.startswith(".") or not entry.is_file():
+                continue
+            stats = entry.stat()
+            rows.append((stats.st_mtime_ns, FileInfo(
+                name=entry.name,
+                path=entry.path,
                 size=stats.st_size,
                 size_formatted=format_size(stats.st_size),
-                modified=datetime.fromtimestamp(stats.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
-                created=datetime.fromtimestamp(stats.st_ctime).strftime("%Y-%m-%d %H:%M:%S")
-            ))
+                modified=format_timestamp(stats.st_mtime),
+                created=format_timestamp(stats.st_ctime)
+            )))
     
     # Sort by modification time (newest first)
-    return sorted(files_info, key=lambda x: x.path, reverse=True)
+    rows.sort(key=itemgetter(0), reverse=True)
+    files_info = [file_info for _, file_info in rows]
+    _FILES_CACHE.update(mtime=dir_mtime, expires=now + FILES_CACHE_TTL, value=files_info)
+    return files_info
 
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """Render the home page."""
-    return templates.TemplateResponse("index.html", {"request": request})
+    return HTMLResponse(_INDEX_TEMPLATE.render({"request": request}))
 
 @app.get("/files", response_class=HTMLResponse)
 async def file_manager(request: Request, message: Optional[str] = None, message_type: Optional[str] = None):
     """Render the file manager page."""
     files = get_excel_files()
-    return templates.TemplateResponse(
-        "files.html", 
+    return HTMLResponse(_FILES_TEMPLATE.render(
         {
             "request": request, 
             "files": files, 
             "message": message, 
             "message_type": message_type or "info"
         }
-    )
+    ))
 
-@app.post("/upload")
-async def upload_file(file: UploadFile = File(...)):
-    """Upload an Excel file."""
+def _check_upload_name(filename: str) -> str:
+    """Validate an uploaded file's name and return its destination path."""
     # Validate file extension
-    if not file.filename.lower().endswith(('.xlsx', '.xls')):
+    if not filename.lower().endswith(('.xlsx', '.xls')):
         raise HTTPException(status_code=400, detail="Only Excel files (.xlsx, .xls) are allowed")
-    
-    # Save the file
-    file_path = Path(EXCEL_FILES_PATH) / file.filename
-    
+    return _safe(filename)
+
+async def _save_one(file: UploadFile, file_path: str) -> Dict[str, Any]:
+    """Stream one uploaded file to disk and return its name and size."""
     try:
-        # Create the directory if it doesn't exist
-        os.makedirs(EXCEL_FILES_PATH, exist_ok=True)
-        
-        # Write the file
+        # Write the file in chunks, with disk writes off the event loop, so
+        # only one chunk of the upload is held in memory at a time
+        size = 0
         with open(file_path, "wb") as buffer:
-            contents = await file.read()
-            buffer.write(contents)
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await asyncio.to_thread(buffer.write, chunk)
+                size += len(chunk)
             
-        return {"filename": file.filename, "size": len(contents)}
+        return {"filename": file.filename, "size": size}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to upload file: {str(e)}")
 
+@app.post("/upload")
+async def upload_file(file: UploadFile = File(...)):
+    """Upload an Excel file."""
+    file_path = _check_upload_name(file.filename)
+    try:
+        return await _save_one(file, file_path)
+    finally:
+        invalidate_files_cache()
+
+@app.post("/upload/batch")
+async def upload_files(files: List[UploadFile] = File(...)):
+    """Upload several Excel files at once."""
+    # Reject the whole batch before writing anything if any name is bad, or
+    # if two files would be written concurrently to the same path
+    file_paths = [_check_upload_name(file.filename) for file in files]
+    if len(set(file_paths)) != len(file_paths):
+        raise HTTPException(status_code=400, detail="Duplicate filenames in upload batch")
+    try:
+        # Save concurrently so one file's disk writes overlap the others' reads.
+        # Wait for every save to finish before reporting the first failure
+        results = await asyncio.gather(*(
+            _save_one(file, file_path) for file, file_path in zip(files, file_paths)
+        ), return_exceptions=True)
+    finally:
+        invalidate_files_cache()
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return {"files": results}
+
+def _not_modified(request: Request, etag: str, mtime: float) -> bool:
+    """Whether the client's conditional headers say its cached copy is current."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence; compare weakly as RFC 9110 asks
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag.removeprefix("W/") in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates are always GMT; don't let a "-0000" zone read as local time
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return int(mtime) <= since.timestamp()
+    return False
+
 @app.get("/download/{filename}")
-async def download_file(filename: str):
+async def download_file(filename: str, request: Request):
     """Download an Excel file."""
-    file_path = Path(EXCEL_FILES_PATH) / filename
+    file_path = _safe(filename)
     
-    if not file_path.exists():
+    # Stat once here and hand the result to FileResponse so it doesn't stat again
+    try:
+        stats = os.stat(file_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="File not found")
+    if not stat.S_ISREG(stats.st_mode):
         raise HTTPException(status_code=404, detail="File not found")
     
+    # Size and mtime identify the file's version, so clients holding it get a 304
+    etag = f'W/"{stats.st_size:x}-{stats.st_mtime_ns:x}"'
+    if _not_modified(request, etag, stats.st_mtime):
+        return Response(status_code=304, headers={
+            "ETag": etag,
+            "Last-Modified": formatdate(stats.st_mtime, usegmt=True)
+        })
+    
     return FileResponse(
-        path=str(file_path),
+        path=file_path,
         filename=filename,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        headers={"ETag": etag},
+        stat_result=stats
     )
 
 @app.get("/delete/{filename}")
 async def delete_file(filename: str):
     """Delete an Excel file."""
-    file_path = Path(EXCEL_FILES_PATH) / filename
-    
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="File not found")
+    file_path = _safe(filename)
     
     try:
         os.remove(file_path)
-        return RedirectResponse(url="/files?message=File deleted successfully&message_type=success")
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="File not found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete file: {str(e)}")
+    
+    invalidate_files_cache()
+    return RedirectResponse(url="/files?message=File deleted successfully&message_type=success")
 
-@app.get("/api/files")
+@app.get("/api/files", response_class=FastJSONResponse)
 async def list_files():
     """API endpoint to list all Excel files."""
     files = get_excel_files()
-    return {"files": [file.dict() for file in files]}
+    return FastJSONResponse({"files": [file.model_dump() for file in files]})
+
+@functools.lru_cache(maxsize=64)
+def _workbook_info_for_version(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Memoized workbook info; the file's mtime and size identify its version."""
+    return get_info_impl(file_path)
+
+def _get_workbook_info(file_path: str) -> Dict[str, Any]:
+    """Workbook info, re-read only when the file has been rewritten."""
+    stats = os.stat(file_path)
+    return dict(_workbook_info_for_version(file_path, stats.st_mtime_ns, stats.st_size))
 
 @app.get("/api/info/{filename}")
 async def get_workbook_info(filename: str):
     """API endpoint to get Excel workbook information."""
-    file_path = get_excel_path(filename)
-    path = Path(file_path)
-    
-    if not path.exists():
-        raise HTTPException(status_code=404, detail="File not found")
+    file_path = _safe(filename)
     
     try:
-        info = get_info_impl(str(file_path))
+        # Parsing the workbook blocks, so keep it off the event loop
+        info = await asyncio.to_thread(_get_workbook_info, file_path)
         return info
     except Exception as e:
+        # Only check whether the file exists once something has gone wrong
+        if not os.path.exists(file_path):
+            raise HTTPException(status_code=404, detail="File not found")
         raise HTTPException(status_code=500, detail=f"Failed to get workbook info: {str(e)}")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "timestamp": time.time()}
+    # Load balancers poll this constantly; format the body directly rather
+    # than going through FastAPI's response encoding
+    return Response(
+        content=b'{"status":"healthy","timestamp":%r}' % time.time(),
+        media_type="application/json"
+    )
 
 # CSV Operations Models
 class CsvImportRequest(BaseModel):
     """Model for CSV import request."""
+    model_config = _MODEL_CONFIG
     csv_content_base64: str
     sheet_name: Optional[str] = None
     delimiter: str = ','
@@ -178,114 +337,99 @@ class CsvImportRequest(BaseModel):
     
 class BulkCsvImportRequest(BaseModel):
     """Model for bulk CSV import request."""
+    model_config = _MODEL_CONFIG
     csv_data_list: List[CsvImportRequest]
     create_if_missing: bool = True
     
 class CsvExportRequest(BaseModel):
     """Model for CSV export request."""
+    model_config = _MODEL_CONFIG
     sheet_name: Optional[str] = None
     delimiter: str = ','
     include_header_row: bool = True
     
 class BulkCsvExportRequest(BaseModel):
     """Model for bulk CSV export request."""
+    model_config = _MODEL_CONFIG
     worksheet_list: List[CsvExportRequest]
 
+def _decode_csv_payload(csv_content_base64: str) -> bytes:
+    """Decode a base64 CSV payload, rejecting malformed input with a 400."""
+    # Clients may wrap base64 lines; only the whitespace is allowed through
+    payload = csv_content_base64.encode("ascii", "replace").translate(None, b" \t\r\n\v\f")
+    try:
+        return base64.b64decode(payload, validate=True)
+    except binascii.Error as e:
+        raise HTTPException(status_code=400, detail=f"Invalid base64 CSV content: {str(e)}")
+
 # CSV Operations API Endpoints
 @app.post("/api/csv/import/{filename}")
 async def api_import_csv(filename: str, request: CsvImportRequest):
     """API endpoint to import CSV data into an Excel file."""
-    from excel_mcp.server import import_csv
+    # Decode once here; the import path takes the bytes as-is
+    csv_bytes = _decode_csv_payload(request.csv_content_base64)
+    result = import_csv_result(
+        _safe(filename),
+        None,
+        csv_bytes=csv_bytes,
+        sheet_name=request.sheet_name,
+        delimiter=request.delimiter,
+        create_if_missing=True,
+        merge_mode=request.merge_mode
+    )
     
-    try:
-        result = import_csv(
-            excel_filename=filename,
-            csv_content_base64=request.csv_content_base64,
-            sheet_name=request.sheet_name,
-            delimiter=request.delimiter,
-            create_if_missing=True,
-            merge_mode=request.merge_mode
-        )
+    if not result.get("success", False):
+        raise HTTPException(status_code=400, detail=result.get("message", "CSV import failed"))
         
-        if not result.get("success", False):
-            raise HTTPException(status_code=400, detail=result.get("message", "CSV import failed"))
-            
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error importing CSV: {str(e)}")
+    return result
 
 @app.post("/api/csv/export/{filename}")
 async def api_export_csv(filename: str, request: CsvExportRequest):
     """API endpoint to export an Excel worksheet to CSV."""
-    from excel_mcp.server import export_worksheet_to_csv
+    result = export_worksheet_to_csv(
+        excel_filename=filename,
+        sheet_name=request.sheet_name,
+        delimiter=request.delimiter,
+        include_header_row=request.include_header_row
+    )
     
-    try:
-        result = export_worksheet_to_csv(
-            excel_filename=filename,
-            sheet_name=request.sheet_name,
-            delimiter=request.delimiter,
-            include_header_row=request.include_header_row
-        )
+    if not result.get("success", False):
+        raise HTTPException(status_code=400, detail=result.get("message", "CSV export failed"))
         
-        if not result.get("success", False):
-            raise HTTPException(status_code=400, detail=result.get("message", "CSV export failed"))
-            
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error exporting to CSV: {str(e)}")
+    return result
 
 @app.post("/api/csv/bulk-import/{filename}")
 async def api_bulk_import_csv(filename: str, request: BulkCsvImportRequest):
     """API endpoint to import multiple CSV data into an Excel file."""
-    from excel_mcp.server import bulk_import_csv
+    # Convert the Pydantic model to the format expected by the function,
+    # decoding each payload once here rather than again in the import path
+    csv_data_list = request.model_dump()["csv_data_list"]
+    for item in csv_data_list:
+        item["csv_bytes"] = _decode_csv_payload(item.pop("csv_content_base64"))
+
+    result = bulk_import_csv_result(
+        _safe(filename),
+        csv_data_list=csv_data_list,
+        create_if_missing=request.create_if_missing
+    )
     
-    try:
-        # Convert the Pydantic model to the format expected by the function
-        csv_data_list = []
-        for item in request.csv_data_list:
-            csv_data_list.append({
-                "csv_content_base64": item.csv_content_base64,
-                "sheet_name": item.sheet_name,
-                "delimiter": item.delimiter,
-                "merge_mode": item.merge_mode
-            })
-            
-        result = bulk_import_csv(
-            excel_filename=filename,
-            csv_data_list=csv_data_list,
-            create_if_missing=request.create_if_missing
-        )
+    if not result.get("success", False):
+        raise HTTPException(status_code=400, detail=result.get("message", "Bulk CSV import failed"))
         
-        if not result.get("success", False):
-            raise HTTPException(status_code=400, detail=result.get("message", "Bulk CSV import failed"))
-            
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error in bulk CSV import: {str(e)}")
+    return result
 
 @app.post("/api/csv/bulk-export/{filename}")
 async def api_bulk_export_csv(filename: str, request: BulkCsvExportRequest):
     """API endpoint to export multiple Excel worksheets to CSV."""
-    from excel_mcp.server import bulk_export_worksheets_to_csv
+    # Convert the Pydantic model to the format expected by the function
+    worksheet_list = request.model_dump()["worksheet_list"]
     
-    try:
-        # Convert the Pydantic model to the format expected by the function
-        worksheet_list = []
-        for item in request.worksheet_list:
-            worksheet_list.append({
-                "sheet_name": item.sheet_name,
-                "delimiter": item.delimiter,
-                "include_header_row": item.include_header_row
-            })
-            
-        result = bulk_export_worksheets_to_csv(
-            excel_filename=filename,
-            worksheet_list=worksheet_list
-        )
+    result = bulk_export_worksheets_to_csv(
+        excel_filename=filename,
+        worksheet_list=worksheet_list
+    )
+    
+    if not result.get("success", False):
+        raise HTTPException(status_code=400, detail=result.get("message", "Bulk CSV export failed"))
         
-        if not result.get("success", False):
-            raise HTTPException(status_code=400, detail=result.get("message", "Bulk CSV export failed"))
-            
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error in bulk CSV export: {str(e)}")
+    return result
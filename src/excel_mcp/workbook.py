@@ -1,6 +1,8 @@
 import logging
+import zipfile
 from pathlib import Path
 from typing import Any
+from xml.etree import ElementTree
 
 from openpyxl import Workbook, load_workbook
 from openpyxl.utils import get_column_letter
@@ -60,20 +62,57 @@ def create_sheet(filepath: str, sheet_name: str) -> dict:
         logger.error(f"Failed to create sheet: {e}")
         raise WorkbookError(str(e))
 
+def _read_sheet_names(filepath: str) -> list[str]:
+    """Read sheet names straight from the workbook part of an .xlsx archive.
+
+    Only the package relationships and workbook.xml are parsed; worksheets,
+    shared strings and styles are never touched.
+    """
+    with zipfile.ZipFile(filepath) as archive:
+        workbook_part = "xl/workbook.xml"
+        with archive.open("_rels/.rels") as fp:
+            for rel in ElementTree.parse(fp).getroot():
+                if rel.get("Type", "").endswith("/officeDocument"):
+                    workbook_part = rel.get("Target").lstrip("/")
+                    break
+
+        sheet_names = []
+        with archive.open(workbook_part) as fp:
+            for _, element in ElementTree.iterparse(fp):
+                if element.tag.endswith("}sheet"):
+                    sheet_names.append(element.get("name"))
+                element.clear()
+        return sheet_names
+
 def get_workbook_info(filepath: str, include_ranges: bool = False) -> dict[str, Any]:
     """Get metadata about workbook including sheets, ranges, etc."""
     try:
         path = Path(filepath)
-        if not path.exists():
+        try:
+            stats = path.stat()
+        except FileNotFoundError:
             raise WorkbookError(f"File not found: {filepath}")
             
+        if not include_ranges:
+            # Sheet names alone don't need openpyxl to load the workbook
+            try:
+                return {
+                    "filename": path.name,
+                    "sheets": _read_sheet_names(filepath),
+                    "size": stats.st_size,
+                    "modified": stats.st_mtime
+                }
+            except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
+                # Let openpyxl report unreadable files the usual way
+                logger.debug(f"Falling back to openpyxl for workbook info: {e}")
+
         wb = load_workbook(filepath, read_only=True)
         
         info = {
             "filename": path.name,
             "sheets": wb.sheetnames,
-            "size": path.stat().st_size,
-            "modified": path.stat().st_mtime
+            "size": stats.st_size,
+            "modified": stats.st_mtime
         }
         
         if include_ranges: